@@ -979,6 +979,11 @@ class ScoresClient(object):
                 "Tried to fetch location {} from ScoresClient before fetch_scores() has run."
                 .format(location)
             )
+        if not self._locations_to_scores:
+            # No scores were found for this user, which is common for
+            # learners who have not attempted any problems yet, so skip
+            # normalizing the location.
+            return None
         return self._locations_to_scores.get(location.replace(version=None, branch=None))
 
     @classmethod
@@ -2,11 +2,13 @@
 Test for lms courseware app, module data (runtime data storage for XBlocks)
 """
 import json
+from bson import ObjectId
 from mock import Mock, patch
 from nose.plugins.attrib import attr
 from functools import partial
+from opaque_keys.edx.locator import CourseLocator
 
-from courseware.model_data import DjangoKeyValueStore, FieldDataCache, InvalidScopeError
+from courseware.model_data import DjangoKeyValueStore, FieldDataCache, InvalidScopeError, ScoresClient
 from courseware.models import StudentModule, XModuleUserStateSummaryField
 from courseware.models import XModuleStudentInfoField, XModuleStudentPrefsField
 
@@ -426,3 +428,42 @@ class TestStudentInfoStorage(OtherUserFailureTestMixin, StorageTestBase, TestCas
     storage_class = XModuleStudentInfoField
     other_key_factory = partial(DjangoKeyValueStore.Key, Scope.user_info, 2, 'mock_problem')  # user_id=2, not 1
     existing_field_name = "existing_field"
+
+
+@attr(shard=1)
+class TestScoresClient(TestCase):
+    """
+    Tests for ScoresClient.get.
+    """
+    def setUp(self):
+        super(TestScoresClient, self).setUp()
+        self.user = UserFactory.create()
+        self.course_key = CourseLocator(u'org', u'course', u'run')
+        self.usage_key = self.course_key.make_usage_key(u'problem', u'mock_block_id')
+        self.scores_client = ScoresClient(self.course_key, self.user.id)
+
+    def test_get_before_fetch(self):
+        with self.assertRaises(ValueError):
+            self.scores_client.get(self.usage_key)
+
+    def test_get_with_no_scores(self):
+        self.scores_client.fetch_scores([self.usage_key])
+        location = Mock()
+        self.assertIsNone(self.scores_client.get(location))
+        self.assertFalse(location.replace.called)
+
+    def test_get_with_scores(self):
+        cmfStudentModuleFactory.create(
+            student=self.user,
+            course_id=self.course_key,
+            module_state_key=self.usage_key,
+            grade=1,
+            max_grade=2,
+        )
+        self.scores_client.fetch_scores([self.usage_key])
+
+        expected_score = ScoresClient.Score(1, 2)
+        self.assertEqual(self.scores_client.get(self.usage_key), expected_score)
+        self.assertEqual(self.scores_client.get(self.usage_key.for_branch(u'draft')), expected_score)
+        self.assertEqual(self.scores_client.get(self.usage_key.for_version(ObjectId())), expected_score)
+        self.assertIsNone(self.scores_client.get(self.course_key.make_usage_key(u'problem', u'other_block_id')))
@@ -21,6 +21,8 @@ from xmodule.graders import Score
 
 log = getLogger(__name__)
 
+_EXPLICIT_GRADED_FIELD_NAME = GradesTransformer.EXPLICIT_GRADED_FIELD_NAME
+
 
 @contextmanager
 def persistence_safe_fallback():
@@ -72,13 +74,19 @@ class SubsectionGrade(object):
         Compute the grade of this subsection for the given student and course.
         """
         assert self._scores is None
-        for descendant_key in course_structure.post_order_traversal(
-                filter_func=possibly_scored,
-                start_node=self.location,
-        ):
-            self._compute_block_score(
-                student, descendant_key, course_structure, scores_client, submissions_scores, persisted_values={},
-            )
+        self._compute_block_scores(
+            student,
+            (
+                (descendant_key, {})
+                for descendant_key in course_structure.post_order_traversal(
+                    filter_func=possibly_scored,
+                    start_node=self.location,
+                )
+            ),
+            course_structure,
+            scores_client,
+            submissions_scores,
+        )
         self.all_total, self.graded_total = graders.aggregate_scores(self.scores, self.display_name, self.location)
         self._log_event(log.info, u"init_from_structure", student)
 
@@ -87,16 +95,16 @@ class SubsectionGrade(object):
         Load the subsection grade from the persisted model.
         """
         assert self._scores is None
-        for block in model.visible_blocks.blocks:
-            persisted_values = {'weight': block.weight, 'possible': block.max_score}
-            self._compute_block_score(
-                student,
-                block.locator,
-                course_structure,
-                scores_client,
-                submissions_scores,
-                persisted_values
-            )
+        self._compute_block_scores(
+            student,
+            (
+                (block.locator, {'weight': block.weight, 'possible': block.max_score})
+                for block in model.visible_blocks.blocks
+            ),
+            course_structure,
+            scores_client,
+            submissions_scores,
+        )
 
         self.graded_total = Score(
             earned=model.earned_graded,
@@ -138,25 +146,37 @@ class SubsectionGrade(object):
         self._log_event(log.info, u"update_or_create_model", student)
         return PersistentSubsectionGrade.update_or_create_grade(**self._persisted_model_params(student))
 
-    def _compute_block_score(
+    def _compute_block_scores(
             self,
             student,
-            block_key,
+            blocks_to_score,
             course_structure,
             scores_client,
             submissions_scores,
-            persisted_values,
     ):
         """
-        Compute score for the given block. If persisted_values
-        is provided, it is used for possible and weight.
+        Compute scores for the given iterable of (block_key, persisted_values)
+        pairs in a single pass. If persisted_values is provided, it is used
+        for possible and weight.
         """
-        block = course_structure[block_key]
+        # Bind loop invariants to locals, since the loop body runs once
+        # for every scorable block in the subsection.
+        locations_to_weighted_scores = self.locations_to_weighted_scores
+        get_explicit_graded = self._get_explicit_graded
+        display_name_with_default_escaped = block_metadata_utils.display_name_with_default_escaped
+
+        for block_key, persisted_values in blocks_to_score:
+            block = course_structure[block_key]
 
-        if getattr(block, 'has_score', False):
+            if not getattr(block, 'has_score', False):
+                continue
 
-            possible = persisted_values.get('possible', None)
-            weight = persisted_values.get('weight', getattr(block, 'weight', None))
+            if persisted_values:
+                possible = persisted_values['possible']
+                weight = persisted_values['weight']
+            else:
+                possible = None
+                weight = getattr(block, 'weight', None)
 
             (earned, possible) = get_score(
                 student,
@@ -174,28 +194,38 @@ class SubsectionGrade(object):
                 #
                 # Cannot grade a problem with a denominator of 0.
                 # TODO: None > 0 is not python 3 compatible.
-                block_graded = self._get_explicit_graded(block, course_structure) if possible > 0 else False
+                if possible > 0:
+                    block_graded = get_explicit_graded(block)
+                    display_name = display_name_with_default_escaped(block)
+                else:
+                    # The score adds nothing to the aggregated totals, so
+                    # don't spend time escaping its display name.
+                    block_graded = False
+                    display_name = u''
 
-                self.locations_to_weighted_scores[block.location] = (
+                locations_to_weighted_scores[block.location] = (
                     Score(
                         earned,
                         possible,
                         block_graded,
-                        block_metadata_utils.display_name_with_default_escaped(block),
+                        display_name,
                         block.location,
                     ),
                     weight,
                 )
 
-    def _get_explicit_graded(self, block, course_structure):
+    def _get_explicit_graded(self, block):
         """
         Returns the explicit graded field value for the given block
         """
-        field_value = course_structure.get_transformer_block_field(
-            block.location,
-            GradesTransformer,
-            GradesTransformer.EXPLICIT_GRADED_FIELD_NAME
-        )
+        # Read the field off the block's own transformer data, rather than
+        # looking the block up again in the course structure.
+        try:
+            transformer_data = block.transformer_data[GradesTransformer]
+        except KeyError:
+            field_value = None
+        else:
+            field_value = getattr(transformer_data, _EXPLICIT_GRADED_FIELD_NAME, None)
 
         # Set to True if grading is not explicitly disabled for
         # this block.  This allows us to include the block's score
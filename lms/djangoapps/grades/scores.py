@@ -3,15 +3,17 @@ Functionality for problem scores.
 """
 from logging import getLogger
 
-from openedx.core.lib.cache_utils import memoized
 from xblock.core import XBlock
 from .transformer import GradesTransformer
 
 
 log = getLogger(__name__)
 
+# Lazily computed by block_types_possibly_scored, since the set of installed
+# XBlock classes is constant for the lifetime of the process.
+_BLOCK_TYPES_POSSIBLY_SCORED = None
+
 
-@memoized
 def block_types_possibly_scored():
     """
     Returns the block types that could have a score.
@@ -21,28 +23,26 @@ def block_types_possibly_scored():
     since those children might have scores. We can avoid things like Videos,
     which have state but cannot ever impact someone's grade.
     """
-    return frozenset(
-        cat for (cat, xblock_class) in XBlock.load_classes() if (
-            getattr(xblock_class, 'has_score', False) or getattr(xblock_class, 'has_children', False)
-        )
-    )
+    global _BLOCK_TYPES_POSSIBLY_SCORED  # pylint: disable=global-statement
+    if _BLOCK_TYPES_POSSIBLY_SCORED is None:
+        # A list comprehension (rather than a generator) runs in this frame,
+        # so the local getattr binding is a fast local lookup in the loop.
+        _getattr = getattr
+        _BLOCK_TYPES_POSSIBLY_SCORED = frozenset([
+            cat for (cat, xblock_class) in XBlock.load_classes() if (
+                _getattr(xblock_class, 'has_score', False) or _getattr(xblock_class, 'has_children', False)
+            )
+        ])
+    return _BLOCK_TYPES_POSSIBLY_SCORED
 
 
 def possibly_scored(usage_key):
     """
     Returns whether the given block could impact grading (i.e. scored, or has children).
     """
-    return usage_key.block_type in block_types_possibly_scored()
-
-
-def weighted_score(raw_earned, raw_possible, weight=None):
-    """
-    Return a tuple that represents the weighted (earned, possible) score.
-    If weight is None or raw_possible is 0, returns the original values.
-    """
-    if weight is None or raw_possible == 0:
-        return (raw_earned, raw_possible)
-    return float(raw_earned) * weight / raw_possible, float(weight)
+    # This is called for every block in a course structure traversal, so
+    # check the cached value directly rather than going through a function call.
+    return usage_key.block_type in (_BLOCK_TYPES_POSSIBLY_SCORED or block_types_possibly_scored())
 
 
 def get_score(user, block, scores_client, submissions_scores_cache, weight, possible=None):
@@ -64,14 +64,15 @@ def get_score(user, block, scores_client, submissions_scores_cache, weight, poss
         calculation.  If None, uses the value found either in scores_client or
         from the block.
     """
-    submissions_scores_cache = submissions_scores_cache or {}
-
     if not user.is_authenticated():
         return (None, None)
 
-    location_url = unicode(block.location)
-    if location_url in submissions_scores_cache:
-        return submissions_scores_cache[location_url]
+    # Only serialize the location when there are submissions scores to look
+    # it up in, since most learners have none.
+    if submissions_scores_cache:
+        submissions_score = submissions_scores_cache.get(unicode(block.location))
+        if submissions_score is not None:
+            return submissions_score
 
     if not getattr(block, 'has_score', False):
         # These are not problems, and do not have a score
@@ -107,4 +108,11 @@ def get_score(user, block, scores_client, submissions_scores_cache, weight, poss
         if possible is None:
             return (None, None)
 
-    return weighted_score(earned, possible, weight)
+    # Return the weighted (earned, possible) score. If weight is None or
+    # possible is 0, return the original values.
+    if weight is None or possible == 0:
+        return (earned, possible)
+    # Converting the weight once is enough to make the division a float
+    # division; earned is already a float or an int.
+    weight = float(weight)
+    return earned * weight / possible, weight
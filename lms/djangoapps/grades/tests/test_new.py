@@ -11,6 +11,7 @@ from capa.tests.response_xml_factory import MultipleChoiceResponseXMLFactory
 from courseware.tests.helpers import get_request_for_user
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.grades.config.tests.utils import persistent_grades_feature_flags
+from openedx.core.lib.block_structure.block_structure import BlockData
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -19,6 +20,7 @@ from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from ..models import PersistentSubsectionGrade
 from ..new.course_grade import CourseGradeFactory
 from ..new.subsection_grade import SubsectionGrade, SubsectionGradeFactory
+from ..transformer import GradesTransformer
 from lms.djangoapps.grades.tests.utils import mock_get_score
 
 
@@ -230,3 +232,88 @@ class SubsectionGradeTest(GradeTestBase):
 
         self.assertEqual(input_grade.url_name, loaded_grade.url_name)
         self.assertEqual(input_grade.all_total, loaded_grade.all_total)
+
+
+@ddt.ddt
+class SubsectionGradeBlockScoresTest(GradeTestBase):
+    """
+    Tests the problem scores that make up a SubsectionGrade.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(SubsectionGradeBlockScoresTest, cls).setUpClass()
+        problem_xml = MultipleChoiceResponseXMLFactory().build_xml(
+            question_text='The correct answer is Choice 1',
+            choices=[True, False],
+            choice_names=['choice_0', 'choice_1']
+        )
+        cls.ungraded_problem = ItemFactory.create(
+            parent=cls.vertical,
+            category="problem",
+            display_name="Ungraded <Problem>",
+            data=problem_xml,
+            graded=False,
+        )
+
+    def _get_block_score(self, subsection_grade, block_location):
+        """
+        Returns the problem Score in the given subsection grade for
+        the given block location.
+        """
+        score, _ = subsection_grade.locations_to_weighted_scores[block_location]
+        return score
+
+    def test_explicit_graded_without_transformer_data(self):
+        block = BlockData(self.problem.location)
+        subsection_grade = SubsectionGrade(self.sequence, self.course)
+        self.assertTrue(subsection_grade._get_explicit_graded(block))  # pylint: disable=protected-access
+
+    @ddt.data(
+        (None, True),
+        (True, True),
+        (False, False),
+    )
+    @ddt.unpack
+    def test_explicit_graded(self, explicit_graded, expected_graded):
+        block = BlockData(self.problem.location)
+        setattr(
+            block.transformer_data.get_or_create(GradesTransformer),
+            GradesTransformer.EXPLICIT_GRADED_FIELD_NAME,
+            explicit_graded,
+        )
+        subsection_grade = SubsectionGrade(self.sequence, self.course)
+        self.assertEqual(
+            subsection_grade._get_explicit_graded(block),  # pylint: disable=protected-access
+            expected_graded,
+        )
+
+    def test_explicitly_ungraded_problem_not_in_graded_total(self):
+        with mock_get_score(1, 2):
+            grade = self.subsection_grade_factory.create(self.sequence)
+
+        self.assertTrue(self._get_block_score(grade, self.problem.location).graded)
+        self.assertFalse(self._get_block_score(grade, self.ungraded_problem.location).graded)
+        self.assertEqual(grade.all_total.earned, 2)
+        self.assertEqual(grade.all_total.possible, 4)
+        self.assertEqual(grade.graded_total.earned, 1)
+        self.assertEqual(grade.graded_total.possible, 2)
+
+    def test_zero_possible_score(self):
+        with mock_get_score(0, 0):
+            grade = self.subsection_grade_factory.create(self.sequence)
+
+        for block_location in (self.problem.location, self.ungraded_problem.location):
+            score = self._get_block_score(grade, block_location)
+            self.assertEqual(score.section, u'')
+            self.assertFalse(score.graded)
+            self.assertEqual(score.module_id, block_location)
+
+    def test_positive_possible_score(self):
+        with mock_get_score(1, 2):
+            grade = self.subsection_grade_factory.create(self.sequence)
+
+        self.assertEqual(self._get_block_score(grade, self.problem.location).section, u'Test Problem')
+        self.assertEqual(
+            self._get_block_score(grade, self.ungraded_problem.location).section,
+            u'Ungraded &lt;Problem&gt;',
+        )
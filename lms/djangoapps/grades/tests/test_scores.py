@@ -0,0 +1,119 @@
+"""
+Tests for grades.scores module.
+"""
+from unittest import TestCase
+
+import ddt
+from mock import Mock
+from opaque_keys.edx.locator import CourseLocator
+
+from courseware.model_data import ScoresClient
+from openedx.core.lib.block_structure.block_structure import BlockData
+
+from .. import scores
+from ..transformer import GradesTransformer
+
+
+class TestScoredBlockTypes(TestCase):
+    """
+    Tests for the possibly_scored function.
+    """
+    course_key = CourseLocator(u'org', u'course', u'run')
+    possibly_scored_block_types = frozenset({
+        'course', 'chapter', 'sequential', 'vertical',
+        'library_content', 'split_test', 'conditional', 'library', 'randomize',
+        'problem', 'lti', 'videosequence', 'problemset', 'wrapper',
+    })
+
+    def test_block_types_possibly_scored(self):
+        self.assertTrue(self.possibly_scored_block_types.issubset(scores.block_types_possibly_scored()))
+
+    def test_block_types_possibly_scored_is_cached(self):
+        self.assertIs(scores.block_types_possibly_scored(), scores.block_types_possibly_scored())
+
+    def test_possibly_scored(self):
+        for block_type in self.possibly_scored_block_types:
+            usage_key = self.course_key.make_usage_key(block_type, 'mock_block_id')
+            self.assertTrue(scores.possibly_scored(usage_key))
+
+    def test_not_possibly_scored(self):
+        for block_type in ('html', 'video', 'about', 'static_tab'):
+            usage_key = self.course_key.make_usage_key(block_type, 'mock_block_id')
+            self.assertFalse(scores.possibly_scored(usage_key))
+
+
+@ddt.ddt
+class TestGetScore(TestCase):
+    """
+    Tests for get_score.
+    """
+    location = CourseLocator(u'org', u'course', u'run').make_usage_key(u'problem', u'mock_block_id')
+
+    def setUp(self):
+        super(TestGetScore, self).setUp()
+        self.user = Mock(**{'is_authenticated.return_value': True})
+
+    def _create_block(self, max_score):
+        """
+        Creates and returns a scorable BlockData with the given max_score.
+        """
+        block = BlockData(self.location)
+        block.has_score = True
+        block.transformer_data.get_or_create(GradesTransformer).max_score = max_score
+        return block
+
+    def _create_scores_client(self, csm_score=None):
+        """
+        Creates and returns a stub ScoresClient that returns the given score.
+        """
+        return Mock(**{'get.return_value': csm_score})
+
+    def test_unauthenticated_user(self):
+        self.user.is_authenticated.return_value = False
+        score = scores.get_score(self.user, self._create_block(10), self._create_scores_client(), {}, None)
+        self.assertEqual(score, (None, None))
+
+    def test_submissions_score_takes_precedence(self):
+        score = scores.get_score(
+            self.user,
+            self._create_block(10),
+            self._create_scores_client(ScoresClient.Score(1, 2)),
+            {unicode(self.location): (3, 4)},
+            None,
+        )
+        self.assertEqual(score, (3, 4))
+
+    @ddt.data(None, {}, {u'i4x://org/course/problem/other_block_id': (3, 4)})
+    def test_no_submissions_score(self, submissions_scores):
+        score = scores.get_score(
+            self.user,
+            self._create_block(10),
+            self._create_scores_client(ScoresClient.Score(1, 2)),
+            submissions_scores,
+            None,
+        )
+        self.assertEqual(score, (1, 2))
+
+    @ddt.data(
+        (None, (0.0, 10)),
+        (5, (0.0, 5.0)),
+    )
+    @ddt.unpack
+    def test_no_csm_score(self, weight, expected_score):
+        score = scores.get_score(self.user, self._create_block(10), self._create_scores_client(), {}, weight)
+        self.assertEqual(score, expected_score)
+
+    def test_no_csm_score_or_max_score(self):
+        score = scores.get_score(self.user, self._create_block(None), self._create_scores_client(), {}, None)
+        self.assertEqual(score, (None, None))
+
+    @ddt.data(
+        (ScoresClient.Score(1, 2), None, (1, 2)),
+        (ScoresClient.Score(1, 2), 10, (5.0, 10.0)),
+        (ScoresClient.Score(None, 2), 10, (0.0, 10.0)),
+        (ScoresClient.Score(0, 0), 10, (0, 0)),
+    )
+    @ddt.unpack
+    def test_weighted_csm_score(self, csm_score, weight, expected_score):
+        score = scores.get_score(self.user, self._create_block(10), self._create_scores_client(csm_score), {}, weight)
+        self.assertEqual(score, expected_score)